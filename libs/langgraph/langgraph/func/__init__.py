@@ -4,6 +4,7 @@ import concurrent.futures
 import functools
 import inspect
 import types
+from inspect import CO_ASYNC_GENERATOR, CO_COROUTINE, CO_GENERATOR
 from typing import (
     Any,
     Awaitable,
@@ -11,6 +12,7 @@ from typing import (
     Optional,
     TypeVar,
     Union,
+    cast,
     overload,
 )
 
@@ -19,18 +21,38 @@ from typing_extensions import ParamSpec
 from langgraph.channels.ephemeral_value import EphemeralValue
 from langgraph.channels.last_value import LastValue
 from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.constants import END, START, TAG_HIDDEN
+from langgraph.constants import CONFIG_KEY_CALL, END, START, TAG_HIDDEN
 from langgraph.pregel import Pregel
 from langgraph.pregel.call import get_runnable_for_func
 from langgraph.pregel.read import PregelNode
 from langgraph.pregel.write import ChannelWrite, ChannelWriteEntry
 from langgraph.store.base import BaseStore
 from langgraph.types import RetryPolicy, StreamMode, StreamWriter
+from langgraph.utils.config import get_configurable
 
 P = ParamSpec("P")
 P1 = TypeVar("P1")
 T = TypeVar("T")
 
+# writer shared by all entrypoints, which write their return value to END
+_END_WRITER = ChannelWrite([ChannelWriteEntry(END)], tags=[TAG_HIDDEN])
+
+
+def _get_code_flags(func: Callable[..., Any]) -> int:
+    """Return the CO_* flags of a function, probing its code object only once."""
+    if (
+        type(func) is types.FunctionType
+        and not hasattr(func, "_is_coroutine_marker")
+        and not hasattr(func, "_is_coroutine")
+    ):
+        return func.__code__.co_flags
+    # partials, callable objects, functions marked as coroutine functions, etc.
+    return (
+        (CO_COROUTINE if asyncio.iscoroutinefunction(func) else 0)
+        | (CO_GENERATOR if inspect.isgeneratorfunction(func) else 0)
+        | (CO_ASYNC_GENERATOR if inspect.isasyncgenfunction(func) else 0)
+    )
+
 
 def call(
     func: Callable[P, T],
@@ -38,13 +60,7 @@ def call(
     retry: Optional[RetryPolicy] = None,
     **kwargs: Any,
 ) -> concurrent.futures.Future[T]:
-    from langgraph.constants import CONFIG_KEY_CALL
-    from langgraph.utils.config import get_configurable
-
-    conf = get_configurable()
-    impl = conf[CONFIG_KEY_CALL]
-    fut = impl(func, (args, kwargs), retry=retry)
-    return fut
+    return get_configurable()[CONFIG_KEY_CALL](func, (args, kwargs), retry=retry)
 
 
 @overload
@@ -84,21 +100,27 @@ def task(
     def decorator(
         func: Union[Callable[P, Awaitable[T]], Callable[P, T]],
     ) -> Callable[P, concurrent.futures.Future[T]]:
-        if asyncio.iscoroutinefunction(func):
+        if _get_code_flags(func) & CO_COROUTINE:
 
             @functools.wraps(func)
             async def _tick(__allargs__: tuple) -> T:
-                return await func(*__allargs__[0], **__allargs__[1])
+                args, kwargs = __allargs__
+                return await cast(Awaitable[T], func(*args, **kwargs))
 
         else:
 
             @functools.wraps(func)
             def _tick(__allargs__: tuple) -> T:
-                return func(*__allargs__[0], **__allargs__[1])
+                args, kwargs = __allargs__
+                return func(*args, **kwargs)
 
-        return functools.update_wrapper(
-            functools.partial(call, _tick, retry=retry), func
-        )
+        @functools.wraps(func)
+        def _call(*args: Any, **kwargs: Any) -> concurrent.futures.Future[T]:
+            return get_configurable()[CONFIG_KEY_CALL](
+                _tick, (args, kwargs), retry=retry
+            )
+
+        return _call
 
     if __func_or_none__ is not None:
         return decorator(__func_or_none__)
@@ -112,7 +134,8 @@ def entrypoint(
     store: Optional[BaseStore] = None,
 ) -> Callable[[types.FunctionType], Pregel]:
     def _imp(func: types.FunctionType) -> Pregel:
-        if inspect.isgeneratorfunction(func):
+        flags = _get_code_flags(func)
+        if flags & CO_GENERATOR:
 
             def gen_wrapper(*args: Any, writer: StreamWriter, **kwargs: Any) -> Any:
                 for chunk in func(*args, **kwargs):
@@ -120,7 +143,7 @@ def entrypoint(
 
             bound = get_runnable_for_func(gen_wrapper)
             stream_mode: StreamMode = "custom"
-        elif inspect.isasyncgenfunction(func):
+        elif flags & CO_ASYNC_GENERATOR:
 
             async def agen_wrapper(
                 *args: Any, writer: StreamWriter, **kwargs: Any
@@ -140,7 +163,7 @@ def entrypoint(
                     bound=bound,
                     triggers=[START],
                     channels=[START],
-                    writers=[ChannelWrite([ChannelWriteEntry(END)], tags=[TAG_HIDDEN])],
+                    writers=[_END_WRITER],
                 )
             },
             channels={START: EphemeralValue(Any), END: LastValue(Any, END)},
@@ -2,7 +2,7 @@ import inspect
 import logging
 import typing
 import warnings
-from functools import partial
+from functools import lru_cache, partial
 from inspect import isclass, isfunction, ismethod, signature
 from types import FunctionType
 from typing import (
@@ -86,6 +86,12 @@ def _get_node_name(node: RunnableLike) -> str:
         raise TypeError(f"Unsupported node type: {type(node)}")
 
 
+@lru_cache(maxsize=1024)
+def _has_type_hints(typ: type) -> bool:
+    # cached, as resolving type hints is slow and node outputs reuse a few types
+    return bool(get_type_hints(typ))
+
+
 class StateNodeSpec(NamedTuple):
     runnable: Runnable
     metadata: Optional[dict[str, Any]]
@@ -665,7 +671,7 @@ class CompiledStateGraph(CompiledGraph):
                     else:
                         updates.extend(_get_updates(i) or ())
                 return updates
-            elif get_type_hints(type(input)):
+            elif _has_type_hints(cast(type, type(input))):
                 return [
                     (k, getattr(input, k))
                     for k in output_keys
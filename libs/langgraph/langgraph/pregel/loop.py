@@ -263,48 +263,51 @@ class PregelLoop(LoopProtocol):
 
     def put_writes(self, task_id: str, writes: Sequence[tuple[str, Any]]) -> None:
         """Put writes for a task, to be read by the next tick."""
-        if not writes:
-            return
-        # deduplicate writes to special channels, last write wins
-        if all(w[0] in WRITES_IDX_MAP for w in writes):
-            writes = list({w[0]: w for w in writes}.values())
-        # save writes
-        for c, v in writes:
-            if (
-                c in WRITES_IDX_MAP
-                and (
-                    idx := next(
-                        (
-                            i
-                            for i, w in enumerate(self.checkpoint_pending_writes)
-                            if w[0] == task_id and w[1] == c
-                        ),
-                        None,
+        self.put_writes_many([(task_id, writes)])
+
+    def put_writes_many(
+        self, writes_by_task: Sequence[tuple[str, Sequence[tuple[str, Any]]]]
+    ) -> None:
+        """Put writes for many tasks at once, to be read by the next tick."""
+        # index of existing writes to special channels, built on first use
+        special_idx: Optional[dict[tuple[str, str], int]] = None
+        checkpoint_config: Optional[RunnableConfig] = None
+        for task_id, writes in writes_by_task:
+            if not writes:
+                continue
+            # deduplicate writes to special channels, last write wins
+            if all(w[0] in WRITES_IDX_MAP for w in writes):
+                writes = list({w[0]: w for w in writes}.values())
+            # save writes
+            for c, v in writes:
+                if c in WRITES_IDX_MAP:
+                    if special_idx is None:
+                        special_idx = {}
+                        for i, w in enumerate(self.checkpoint_pending_writes):
+                            if w[1] in WRITES_IDX_MAP:
+                                special_idx.setdefault((w[0], w[1]), i)
+                    if (idx := special_idx.get((task_id, c))) is not None:
+                        self.checkpoint_pending_writes[idx] = (task_id, c, v)
+                        continue
+                    special_idx[(task_id, c)] = len(self.checkpoint_pending_writes)
+                self.checkpoint_pending_writes.append((task_id, c, v))
+            if self.checkpointer_put_writes is not None:
+                if checkpoint_config is None:
+                    checkpoint_config = patch_configurable(
+                        self.checkpoint_config,
+                        {
+                            CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
+                                CONFIG_KEY_CHECKPOINT_NS, ""
+                            ),
+                            CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
+                        },
                     )
+                self.submit(
+                    self.checkpointer_put_writes, checkpoint_config, writes, task_id
                 )
-                is not None
-            ):
-                self.checkpoint_pending_writes[idx] = (task_id, c, v)
-            else:
-                self.checkpoint_pending_writes.append((task_id, c, v))
-        if self.checkpointer_put_writes is not None:
-            self.submit(
-                self.checkpointer_put_writes,
-                patch_configurable(
-                    self.checkpoint_config,
-                    {
-                        CONFIG_KEY_CHECKPOINT_NS: self.config[CONF].get(
-                            CONFIG_KEY_CHECKPOINT_NS, ""
-                        ),
-                        CONFIG_KEY_CHECKPOINT_ID: self.checkpoint["id"],
-                    },
-                ),
-                writes,
-                task_id,
-            )
-        # output writes
-        if hasattr(self, "tasks"):
-            self._output_writes(task_id, writes)
+            # output writes
+            if hasattr(self, "tasks"):
+                self._output_writes(task_id, writes)
 
     def accept_push(
         self, task: PregelExecutableTask, write_idx: int, call: Optional[Call] = None
@@ -1,6 +1,7 @@
 import asyncio
 import concurrent.futures
-from typing import Union
+from concurrent.futures._base import CANCELLED, CANCELLED_AND_NOTIFIED
+from typing import Any, Optional, Union
 
 AnyFuture = Union[asyncio.Future, concurrent.futures.Future]
 
@@ -29,21 +30,43 @@ def _convert_future_exc(exc: BaseException) -> BaseException:
         return exc
 
 
+def _get_snapshot(source: AnyFuture) -> tuple[bool, Any, Optional[BaseException]]:
+    """Return (cancelled, result, exception) of a done future.
+
+    For a concurrent.futures.Future this reads all three under a single
+    acquisition of its lock, instead of one per cancelled/exception/result call.
+    """
+    if asyncio.isfuture(source):
+        if source.cancelled():
+            return True, None, None
+        exception = source.exception()
+        return False, None if exception is not None else source.result(), exception
+    if hasattr(source, "_get_snapshot"):
+        # Python 3.14+
+        _, cancelled, result, exception = source._get_snapshot()
+        return cancelled, result, exception
+    with source._condition:
+        return (
+            source._state in (CANCELLED, CANCELLED_AND_NOTIFIED),
+            source._result,
+            source._exception,
+        )
+
+
 def _set_concurrent_future_state(
     concurrent: concurrent.futures.Future,
     source: AnyFuture,
 ) -> None:
     """Copy state from a future to a concurrent.futures.Future."""
     assert source.done()
-    if source.cancelled():
+    cancelled, result, exception = _get_snapshot(source)
+    if cancelled:
         concurrent.cancel()
     if not concurrent.set_running_or_notify_cancel():
         return
-    exception = source.exception()
     if exception is not None:
         concurrent.set_exception(_convert_future_exc(exception))
     else:
-        result = source.result()
         concurrent.set_result(result)
 
 
@@ -56,15 +79,13 @@ def _copy_future_state(source: AnyFuture, dest: asyncio.Future) -> None:
     if dest.cancelled():
         return
     assert not dest.done()
-    if source.cancelled():
+    cancelled, result, exception = _get_snapshot(source)
+    if cancelled:
         dest.cancel()
+    elif exception is not None:
+        dest.set_exception(_convert_future_exc(exception))
     else:
-        exception = source.exception()
-        if exception is not None:
-            dest.set_exception(_convert_future_exc(exception))
-        else:
-            result = source.result()
-            dest.set_result(result)
+        dest.set_result(result)
 
 
 def _chain_future(source: AnyFuture, destination: AnyFuture) -> None:
@@ -173,7 +173,6 @@ class RunnableCallable(Runnable):
             elif kwargs.get(kw) is None:
                 kwargs[kw] = _conf.get(ck, defv)
 
-        context = copy_context()
         if self.trace:
             callback_manager = get_callback_manager_for_config(config, self.tags)
             run_manager = callback_manager.on_chain_start(
@@ -193,6 +192,7 @@ class RunnableCallable(Runnable):
             else:
                 run_manager.on_chain_end(ret)
         else:
+            context = copy_context()
             context.run(_set_config_context, config)
             ret = context.run(self.func, input, **kwargs)
         if isinstance(ret, Runnable) and self.recurse:
@@ -31,6 +31,7 @@ from langchain_core.runnables import (
     RunnableConfig,
     RunnableLambda,
     RunnablePassthrough,
+    ensure_config,
 )
 from langsmith import traceable
 from pytest_mock import MockerFixture
@@ -55,6 +56,7 @@ from langgraph.constants import (
     ERROR,
     FF_SEND_V2,
     PULL,
+    SCHEDULED,
     START,
 )
 from langgraph.errors import InvalidUpdateError, MultipleSubgraphsError
@@ -63,6 +65,7 @@ from langgraph.graph import END, Graph, StateGraph
 from langgraph.graph.message import MessageGraph, MessagesState, add_messages
 from langgraph.prebuilt.tool_node import ToolNode
 from langgraph.pregel import Channel, GraphRecursionError, Pregel, StateSnapshot
+from langgraph.pregel.loop import SyncPregelLoop
 from langgraph.pregel.retry import RetryPolicy
 from langgraph.store.base import BaseStore
 from langgraph.types import (
@@ -273,6 +276,47 @@ def test_checkpoint_errors() -> None:
         graph.invoke("", {"configurable": {"thread_id": "thread-1"}})
 
 
+def test_put_writes_many() -> None:
+    def logic(inp: str) -> str:
+        return ""
+
+    builder = StateGraph(Annotated[str, operator.add])
+    builder.add_node("agent", logic)
+    builder.add_edge(START, "agent")
+    graph = builder.compile(checkpointer=MemorySaver())
+
+    with SyncPregelLoop(
+        "",
+        config=ensure_config({"configurable": {"thread_id": "1"}}),
+        stream=None,
+        store=None,
+        checkpointer=graph.checkpointer,
+        nodes=graph.nodes,
+        specs=graph.channels,
+        output_keys=graph.output_channels,
+        stream_keys=graph.stream_channels,
+    ) as loop:
+        assert loop.tick(input_keys=graph.input_channels)
+        one, two = str(uuid.uuid4()), str(uuid.uuid4())
+        err1, err2 = ValueError("1"), ValueError("2")
+        loop.put_writes_many(
+            [
+                (one, [(SCHEDULED, 1)]),
+                (two, [(SCHEDULED, 1)]),
+                (one, [(SCHEDULED, 2), (SCHEDULED, 3)]),
+                (two, [(ERROR, err1)]),
+                (two, []),
+                (two, [(ERROR, err2)]),
+            ]
+        )
+        # last write wins for each task and special channel
+        assert [w for w in loop.checkpoint_pending_writes if w[0] in (one, two)] == [
+            (one, SCHEDULED, 3),
+            (two, SCHEDULED, 1),
+            (two, ERROR, err2),
+        ]
+
+
 def test_node_schemas_custom_output() -> None:
     class State(TypedDict):
         hello: str
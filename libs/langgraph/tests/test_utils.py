@@ -1,3 +1,5 @@
+import asyncio
+import concurrent.futures
 import functools
 import sys
 import uuid
@@ -25,6 +27,7 @@ from langgraph.utils.fields import (
     get_enhanced_type_hints,
     get_field_default,
 )
+from langgraph.utils.future import _chain_future, chain_future
 from langgraph.utils.runnable import is_async_callable, is_async_generator
 
 pytestmark = pytest.mark.anyio
@@ -284,3 +287,50 @@ def test_enhanced_type_hints() -> None:
     assert hints[0] == ("val_1", str, None, "A description")
     assert hints[1] == ("val_2", int, 42, None)
     assert hints[2] == ("val_3", str, "default", "Another description")
+
+
+def test_chain_future() -> None:
+    # result
+    source: concurrent.futures.Future = concurrent.futures.Future()
+    dest: concurrent.futures.Future = concurrent.futures.Future()
+    chain_future(source, dest)
+    source.set_result(1)
+    assert dest.result() == 1
+    # exception
+    source = concurrent.futures.Future()
+    dest = concurrent.futures.Future()
+    chain_future(source, dest)
+    source.set_exception(ValueError("oops"))
+    with pytest.raises(ValueError, match="oops"):
+        dest.result()
+    # cancellation
+    source = concurrent.futures.Future()
+    dest = concurrent.futures.Future()
+    chain_future(source, dest)
+    source.cancel()
+    assert dest.cancelled()
+
+
+async def test_chain_future_to_asyncio_future() -> None:
+    loop = asyncio.get_running_loop()
+    # result
+    source: concurrent.futures.Future = concurrent.futures.Future()
+    dest: asyncio.Future = loop.create_future()
+    _chain_future(source, dest)
+    source.set_result(1)
+    assert await dest == 1
+    # exception
+    source = concurrent.futures.Future()
+    dest = loop.create_future()
+    _chain_future(source, dest)
+    source.set_exception(ValueError("oops"))
+    with pytest.raises(ValueError, match="oops"):
+        await dest
+    # cancellation
+    source = concurrent.futures.Future()
+    dest = loop.create_future()
+    _chain_future(source, dest)
+    source.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await dest
+    assert dest.cancelled()
@@ -1,3 +1,5 @@
+from typing import Any
+
 import aiokafka
 
 
@@ -6,4 +8,8 @@ class DefaultAsyncConsumer(aiokafka.AIOKafkaConsumer):
 
 
 class DefaultAsyncProducer(aiokafka.AIOKafkaProducer):
-    pass
+    def __init__(
+        self, *, linger_ms: int = 5, max_batch_size: int = 65536, **kwargs: Any
+    ) -> None:
+        # wait briefly for more messages, to send fewer, larger produce requests
+        super().__init__(linger_ms=linger_ms, max_batch_size=max_batch_size, **kwargs)
@@ -1,5 +1,5 @@
 import concurrent.futures
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence
 
 from kafka import KafkaConsumer, KafkaProducer
 from langgraph.scheduler.kafka.types import ConsumerRecord, TopicPartition
@@ -19,6 +19,12 @@ class DefaultConsumer(KafkaConsumer):
 
 
 class DefaultProducer(KafkaProducer):
+    def __init__(self, **configs: Any) -> None:
+        # wait briefly for more messages, to send fewer, larger produce requests
+        configs.setdefault("linger_ms", 5)
+        configs.setdefault("batch_size", 65536)
+        super().__init__(**configs)
+
     def send(
         self,
         topic: str,
@@ -54,6 +54,10 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         *,
         batch_max_n: int = 10,
         batch_max_ms: int = 1000,
+        fetch_min_bytes: int = 1,
+        fetch_max_wait_ms: int = 100,
+        max_partition_fetch_bytes: int = 1024 * 1024,
+        batch_max_bytes: int = 4 * 1024 * 1024,
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[AsyncConsumer] = None,
         producer: Optional[AsyncProducer] = None,
@@ -67,6 +71,10 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.fetch_min_bytes = fetch_min_bytes
+        self.fetch_max_wait_ms = fetch_max_wait_ms
+        self.max_partition_fetch_bytes = max_partition_fetch_bytes
+        self.batch_max_bytes = batch_max_bytes
         self.retry_policy = retry_policy
 
     async def __aenter__(self) -> Self:
@@ -83,6 +91,12 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
                     auto_offset_reset="earliest",
                     group_id="executor",
                     enable_auto_commit=False,
+                    fetch_min_bytes=self.fetch_min_bytes,
+                    fetch_max_wait_ms=self.fetch_max_wait_ms,
+                    max_partition_fetch_bytes=min(
+                        self.max_partition_fetch_bytes, self.batch_max_bytes
+                    ),
+                    fetch_max_bytes=self.batch_max_bytes,
                     loop=loop,
                     **self.kwargs,
                 )
@@ -109,9 +123,9 @@ class AsyncKafkaExecutor(AbstractAsyncContextManager):
         recs = await self.consumer.getmany(
             timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
         )
-        msgs: list[MessageToExecutor] = [
-            serde.loads(msg.value) for msgs in recs.values() for msg in msgs
-        ]
+        msgs: list[MessageToExecutor] = await serde.aloads_many(
+            [msg.value for msgs in recs.values() for msg in msgs]
+        )
         # process batch
         await asyncio.gather(*(self.each(msg) for msg in msgs))
         # commit offsets
@@ -271,6 +285,10 @@ class KafkaExecutor(AbstractContextManager):
         *,
         batch_max_n: int = 10,
         batch_max_ms: int = 1000,
+        fetch_min_bytes: int = 1,
+        fetch_max_wait_ms: int = 100,
+        max_partition_fetch_bytes: int = 1024 * 1024,
+        batch_max_bytes: int = 4 * 1024 * 1024,
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[Consumer] = None,
         producer: Optional[Producer] = None,
@@ -284,6 +302,10 @@ class KafkaExecutor(AbstractContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.fetch_min_bytes = fetch_min_bytes
+        self.fetch_max_wait_ms = fetch_max_wait_ms
+        self.max_partition_fetch_bytes = max_partition_fetch_bytes
+        self.batch_max_bytes = batch_max_bytes
         self.retry_policy = retry_policy
 
     def __enter__(self) -> Self:
@@ -298,6 +320,12 @@ class KafkaExecutor(AbstractContextManager):
                     auto_offset_reset="earliest",
                     group_id="executor",
                     enable_auto_commit=False,
+                    fetch_min_bytes=self.fetch_min_bytes,
+                    fetch_max_wait_ms=self.fetch_max_wait_ms,
+                    max_partition_fetch_bytes=min(
+                        self.max_partition_fetch_bytes, self.batch_max_bytes
+                    ),
+                    fetch_max_bytes=self.batch_max_bytes,
                     **self.kwargs,
                 )
             )
@@ -322,9 +350,9 @@ class KafkaExecutor(AbstractContextManager):
         recs = self.consumer.getmany(
             timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
         )
-        msgs: list[MessageToExecutor] = [
-            serde.loads(msg.value) for msgs in recs.values() for msg in msgs
-        ]
+        msgs: list[MessageToExecutor] = serde.loads_many(
+            [msg.value for msgs in recs.values() for msg in msgs]
+        )
         # process batch
         concurrent.futures.wait(self.submit(self.each, msg) for msg in msgs)
         # commit offsets
@@ -6,8 +6,9 @@ from contextlib import (
     AsyncExitStack,
     ExitStack,
 )
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
+from aiokafka.errors import CommitFailedError, IllegalStateError
 from langchain_core.runnables import ensure_config
 from typing_extensions import Self
 
@@ -22,24 +23,31 @@ from langgraph.constants import (
 )
 from langgraph.errors import CheckpointNotLatest, GraphInterrupt
 from langgraph.pregel import Pregel
-from langgraph.pregel.executor import BackgroundExecutor, Submit
+from langgraph.pregel.executor import BackgroundExecutor, Submit, gated
 from langgraph.pregel.loop import AsyncPregelLoop, SyncPregelLoop
 from langgraph.scheduler.kafka.retry import aretry, retry
 from langgraph.scheduler.kafka.types import (
     AsyncConsumer,
     AsyncProducer,
     Consumer,
+    ConsumerRecord,
     ErrorMessage,
     ExecutorTask,
     MessageToExecutor,
     MessageToOrchestrator,
     Producer,
+    TopicPartition,
     Topics,
 )
 from langgraph.types import RetryPolicy
 from langgraph.utils.config import patch_configurable
 
 
+def _dedupe(recs: dict[TopicPartition, Sequence[ConsumerRecord]]) -> list[bytes]:
+    # keep first occurrence of each payload, in arrival order
+    return list(dict.fromkeys(msg.value for msgs in recs.values() for msg in msgs))
+
+
 class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
     consumer: AsyncConsumer
 
@@ -54,6 +62,11 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[AsyncConsumer] = None,
         producer: Optional[AsyncProducer] = None,
+        max_concurrency: int = 32,
+        fetch_min_bytes: int = 1,
+        fetch_max_wait_ms: int = 100,
+        max_partition_fetch_bytes: int = 1024 * 1024,
+        batch_max_bytes: int = 4 * 1024 * 1024,
         **kwargs: Any,
     ) -> None:
         self.graph = graph
@@ -64,13 +77,20 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.max_concurrency = max_concurrency
+        self.fetch_min_bytes = fetch_min_bytes
+        self.fetch_max_wait_ms = fetch_max_wait_ms
+        self.max_partition_fetch_bytes = max_partition_fetch_bytes
+        self.batch_max_bytes = batch_max_bytes
         self.retry_policy = retry_policy
+        self.pending_commits: list[asyncio.Task] = []
 
     async def __aenter__(self) -> Self:
         loop = asyncio.get_running_loop()
         self.subgraphs = {
             k: v async for k, v in self.graph.aget_subgraphs(recurse=True)
         }
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
         if self.consumer is None:
             from langgraph.scheduler.kafka.default_async import DefaultAsyncConsumer
 
@@ -80,6 +100,12 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
                     auto_offset_reset="earliest",
                     group_id="orchestrator",
                     enable_auto_commit=False,
+                    fetch_min_bytes=self.fetch_min_bytes,
+                    fetch_max_wait_ms=self.fetch_max_wait_ms,
+                    max_partition_fetch_bytes=min(
+                        self.max_partition_fetch_bytes, self.batch_max_bytes
+                    ),
+                    fetch_max_bytes=self.batch_max_bytes,
                     loop=loop,
                     **self.kwargs,
                 )
@@ -96,26 +122,62 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        return await self.stack.__aexit__(*args)
+        try:
+            # wait for offsets of last batch to be committed
+            if self.pending_commits:
+                await asyncio.gather(*self.pending_commits)
+        finally:
+            self.pending_commits.clear()
+            suppress = await self.stack.__aexit__(*args)
+        return suppress
 
     def __aiter__(self) -> Self:
         return self
 
     async def __anext__(self) -> list[MessageToOrchestrator]:
-        # wait for next batch
-        recs = await self.consumer.getmany(
-            timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
+        # wait for next batch, while offsets of previous batch are committed
+        recs, *_ = await asyncio.gather(
+            self.consumer.getmany(
+                timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
+            ),
+            *self.pending_commits,
+        )
+        self.pending_commits.clear()
+        # process each partition concurrently, committing each as soon as it's done
+        batches = await asyncio.gather(
+            *(self.each_partition(tp, records) for tp, records in recs.items())
         )
+        # return messages
+        return [msg for batch in batches for msg in batch]
+
+    async def each_partition(
+        self, tp: TopicPartition, records: Sequence[ConsumerRecord]
+    ) -> list[MessageToOrchestrator]:
         # dedupe messages, eg. if multiple nodes finish around same time
-        uniq = set(msg.value for msgs in recs.values() for msg in msgs)
-        msgs: list[MessageToOrchestrator] = [serde.loads(msg) for msg in uniq]
-        # process batch
-        await asyncio.gather(*(self.each(msg) for msg in msgs))
-        # commit offsets
-        await self.consumer.commit()
-        # return message
+        msgs: list[MessageToOrchestrator] = await serde.aloads_many(
+            _dedupe({tp: records})
+        )
+        # process messages
+        await asyncio.gather(*(gated(self.semaphore, self.each(msg)) for msg in msgs))
+        # commit offsets in the background, overlapping with the next fetch
+        self.pending_commits.append(
+            asyncio.create_task(self.commit({tp: records[-1].offset + 1}))
+        )
         return msgs
 
+    async def commit(self, offsets: dict[TopicPartition, int]) -> None:
+        # skip partitions revoked by a rebalance while their batch was processed
+        assigned = self.consumer.assignment()
+        offsets = {tp: offset for tp, offset in offsets.items() if tp in assigned}
+        if not offsets:
+            return
+        try:
+            await self.consumer.commit(offsets)
+        except (CommitFailedError, IllegalStateError):
+            # partitions were revoked by a rebalance, their new owner will
+            # resume from the last committed offsets
+            pass
+
     async def each(self, msg: MessageToOrchestrator) -> None:
         try:
             await aretry(self.retry_policy, self.attempt, msg)
@@ -173,49 +235,51 @@ class AsyncKafkaOrchestrator(AbstractAsyncContextManager):
                 if new_tasks := [
                     t for t in loop.tasks.values() if not t.scheduled and not t.writes
                 ]:
-                    # send messages to executor
-                    futures = await asyncio.gather(
-                        *(
-                            self.producer.send(
-                                self.topics.executor,
-                                value=serde.dumps(
-                                    MessageToExecutor(
-                                        config=patch_configurable(
-                                            loop.config,
-                                            {
-                                                **loop.checkpoint_config[
-                                                    "configurable"
-                                                ],
-                                                CONFIG_KEY_DEDUPE_TASKS: True,
-                                                CONFIG_KEY_ENSURE_LATEST: True,
-                                            },
-                                        ),
-                                        task=ExecutorTask(id=task.id, path=task.path),
-                                        finally_send=msg.get("finally_send"),
-                                    )
-                                ),
-                            )
-                            for task in new_tasks
-                        )
+                    # config is the same for all tasks of this step
+                    config = patch_configurable(
+                        loop.config,
+                        {
+                            **loop.checkpoint_config["configurable"],
+                            CONFIG_KEY_DEDUPE_TASKS: True,
+                            CONFIG_KEY_ENSURE_LATEST: True,
+                        },
                     )
-                    # wait for messages to be sent
-                    await asyncio.gather(*futures)
-                    # mark as scheduled
-                    for task in new_tasks:
-                        loop.put_writes(
-                            task.id,
-                            [
-                                (
-                                    SCHEDULED,
-                                    max(
-                                        loop.checkpoint["versions_seen"]
-                                        .get(INTERRUPT, {})
-                                        .values(),
-                                        default=None,
-                                    ),
+                    # enqueue messages to executor, without yielding between them
+                    # so that the producer can pack them into a single request
+                    futures = [
+                        await self.producer.send(
+                            self.topics.executor,
+                            value=serde.dumps(
+                                MessageToExecutor(
+                                    config=config,
+                                    task=ExecutorTask(id=task.id, path=task.path),
+                                    finally_send=msg.get("finally_send"),
                                 )
-                            ],
+                            ),
+                            # use task id as partition key
+                            key=serde.dumps(task.id),
                         )
+                        for task in new_tasks
+                    ]
+                    # wait for messages to be sent
+                    await self.producer.flush()
+                    # raise any delivery errors
+                    for fut in futures:
+                        fut.result()
+                    # mark as scheduled
+                    interrupt_version = max(
+                        loop.checkpoint["versions_seen"].get(INTERRUPT, {}).values(),
+                        default=None,
+                    )
+                    # mark all tasks in one call, so pending writes are scanned once
+                    # rather than once per task (O(N) instead of O(N^2)), the
+                    # checkpointer still receives one write per task
+                    loop.put_writes_many(
+                        [
+                            (task.id, [(SCHEDULED, interrupt_version)])
+                            for task in new_tasks
+                        ]
+                    )
             elif loop.status == "done" and msg.get("finally_send"):
                 # send any finally_send messages
                 futs = await asyncio.gather(
@@ -248,6 +312,11 @@ class KafkaOrchestrator(AbstractContextManager):
         retry_policy: Optional[RetryPolicy] = None,
         consumer: Optional[Consumer] = None,
         producer: Optional[Producer] = None,
+        max_concurrency: int = 32,
+        fetch_min_bytes: int = 1,
+        fetch_max_wait_ms: int = 100,
+        max_partition_fetch_bytes: int = 1024 * 1024,
+        batch_max_bytes: int = 4 * 1024 * 1024,
         **kwargs: Any,
     ) -> None:
         self.graph = graph
@@ -258,11 +327,18 @@ class KafkaOrchestrator(AbstractContextManager):
         self.producer = producer
         self.batch_max_n = batch_max_n
         self.batch_max_ms = batch_max_ms
+        self.max_concurrency = max_concurrency
+        self.fetch_min_bytes = fetch_min_bytes
+        self.fetch_max_wait_ms = fetch_max_wait_ms
+        self.max_partition_fetch_bytes = max_partition_fetch_bytes
+        self.batch_max_bytes = batch_max_bytes
         self.retry_policy = retry_policy
 
     def __enter__(self) -> Self:
         self.subgraphs = dict(self.graph.get_subgraphs(recurse=True))
-        self.submit = self.stack.enter_context(BackgroundExecutor({}))
+        self.submit = self.stack.enter_context(
+            BackgroundExecutor({"max_concurrency": self.max_concurrency})
+        )
         if self.consumer is None:
             from langgraph.scheduler.kafka.default_sync import DefaultConsumer
 
@@ -272,6 +348,12 @@ class KafkaOrchestrator(AbstractContextManager):
                     auto_offset_reset="earliest",
                     group_id="orchestrator",
                     enable_auto_commit=False,
+                    fetch_min_bytes=self.fetch_min_bytes,
+                    fetch_max_wait_ms=self.fetch_max_wait_ms,
+                    max_partition_fetch_bytes=min(
+                        self.max_partition_fetch_bytes, self.batch_max_bytes
+                    ),
+                    fetch_max_bytes=self.batch_max_bytes,
                     **self.kwargs,
                 )
             )
@@ -297,8 +379,8 @@ class KafkaOrchestrator(AbstractContextManager):
             timeout_ms=self.batch_max_ms, max_records=self.batch_max_n
         )
         # dedupe messages, eg. if multiple nodes finish around same time
-        uniq = set(msg.value for msgs in recs.values() for msg in msgs)
-        msgs: list[MessageToOrchestrator] = [serde.loads(msg) for msg in uniq]
+        uniq = _dedupe(recs)
+        msgs: list[MessageToOrchestrator] = serde.loads_many(uniq)
         # process batch
         concurrent.futures.wait(self.submit(self.each, msg) for msg in msgs)
         # commit offsets
@@ -363,45 +445,47 @@ class KafkaOrchestrator(AbstractContextManager):
                 if new_tasks := [
                     t for t in loop.tasks.values() if not t.scheduled and not t.writes
                 ]:
+                    # config is the same for all tasks of this step
+                    config = patch_configurable(
+                        loop.config,
+                        {
+                            **loop.checkpoint_config["configurable"],
+                            CONFIG_KEY_DEDUPE_TASKS: True,
+                            CONFIG_KEY_ENSURE_LATEST: True,
+                        },
+                    )
                     # send messages to executor
                     futures = [
                         self.producer.send(
                             self.topics.executor,
                             value=serde.dumps(
                                 MessageToExecutor(
-                                    config=patch_configurable(
-                                        loop.config,
-                                        {
-                                            **loop.checkpoint_config["configurable"],
-                                            CONFIG_KEY_DEDUPE_TASKS: True,
-                                            CONFIG_KEY_ENSURE_LATEST: True,
-                                        },
-                                    ),
+                                    config=config,
                                     task=ExecutorTask(id=task.id, path=task.path),
                                     finally_send=msg.get("finally_send"),
                                 )
                             ),
+                            # use task id as partition key
+                            key=serde.dumps(task.id),
                         )
                         for task in new_tasks
                     ]
                     # wait for messages to be sent
                     concurrent.futures.wait(futures)
                     # mark as scheduled
-                    for task in new_tasks:
-                        loop.put_writes(
-                            task.id,
-                            [
-                                (
-                                    SCHEDULED,
-                                    max(
-                                        loop.checkpoint["versions_seen"]
-                                        .get(INTERRUPT, {})
-                                        .values(),
-                                        default=None,
-                                    ),
-                                )
-                            ],
-                        )
+                    interrupt_version = max(
+                        loop.checkpoint["versions_seen"].get(INTERRUPT, {}).values(),
+                        default=None,
+                    )
+                    # mark all tasks in one call, so pending writes are scanned once
+                    # rather than once per task (O(N) instead of O(N^2)), the
+                    # checkpointer still receives one write per task
+                    loop.put_writes_many(
+                        [
+                            (task.id, [(SCHEDULED, interrupt_version)])
+                            for task in new_tasks
+                        ]
+                    )
             elif loop.status == "done" and msg.get("finally_send"):
                 # schedule any finally_send msgs
                 futs = [
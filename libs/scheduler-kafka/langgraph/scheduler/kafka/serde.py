@@ -1,4 +1,5 @@
-from typing import Any
+import asyncio
+from typing import Any, Sequence
 
 import orjson
 
@@ -6,9 +7,53 @@ from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
 SERIALIZER = JsonPlusSerializer()
 
+# larger payloads that need the checkpointer serializer are parsed in a thread
+LOADS_IN_THREAD_MIN_BYTES = 64 * 1024
+
 
 def loads(v: bytes) -> Any:
-    return SERIALIZER.loads(v)
+    result = _fast_loads(v)
+    return SERIALIZER.loads(v) if result is _SLOW else result
+
+
+def loads_many(vs: Sequence[bytes]) -> list[Any]:
+    # parse each payload on its own, so a malformed one raises rather than
+    # spilling into its neighbours in the batch
+    return [loads(v) for v in vs]
+
+
+async def aloads_many(vs: Sequence[bytes]) -> list[Any]:
+    results = [_fast_loads(v) for v in vs]
+    if slow := [i for i, r in enumerate(results) if r is _SLOW]:
+        slow_vs = [vs[i] for i in slow]
+        if sum(len(v) for v in slow_vs) >= LOADS_IN_THREAD_MIN_BYTES:
+            # the serializer runs a Python hook for every dict, where the GIL can
+            # switch back to the event loop, so parse large payloads in a thread
+            revived = await asyncio.to_thread(_slow_loads_many, slow_vs)
+        else:
+            revived = _slow_loads_many(slow_vs)
+        for i, r in zip(slow, revived):
+            results[i] = r
+    return results
+
+
+_SLOW = object()
+
+
+def _fast_loads(v: bytes) -> Any:
+    if b'"lc"' not in v:
+        # no serialized LangChain objects to revive, so skip the per-dict hook
+        try:
+            # orjson holds the GIL throughout, so a thread wouldn't unblock the loop
+            return orjson.loads(v)
+        except orjson.JSONDecodeError:
+            # eg. NaN written by the checkpointer serializer, which orjson rejects
+            pass
+    return _SLOW
+
+
+def _slow_loads_many(vs: Sequence[bytes]) -> list[Any]:
+    return [SERIALIZER.loads(v) for v in vs]
 
 
 def dumps(v: Any) -> bytes:
@@ -75,7 +75,11 @@ class AsyncConsumer(Protocol):
         self, timeout_ms: int, max_records: int
     ) -> dict[TopicPartition, Sequence[ConsumerRecord]]: ...
 
-    async def commit(self) -> None: ...
+    async def commit(
+        self, offsets: Optional[dict[TopicPartition, int]] = None
+    ) -> None: ...
+
+    def assignment(self) -> set[TopicPartition]: ...
 
 
 class Producer(Protocol):
@@ -96,3 +100,5 @@ class AsyncProducer(Protocol):
         key: Optional[bytes] = None,
         value: Optional[bytes] = None,
     ) -> asyncio.Future: ...
+
+    async def flush(self) -> None: ...
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any, Optional, Sequence
+
+import orjson
+import pytest
+from aiokafka.errors import CommitFailedError
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from langgraph.graph import START, StateGraph
+from langgraph.scheduler.kafka.orchestrator import AsyncKafkaOrchestrator
+from langgraph.scheduler.kafka.types import MessageToOrchestrator, Topics
+
+pytestmark = pytest.mark.anyio
+
+TOPICS = Topics(orchestrator="o", executor="e", error="z")
+P0 = TopicPartition("o", 0)
+P1 = TopicPartition("o", 1)
+
+
+def record(tp: TopicPartition, offset: int, value: Any) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic=tp.topic,
+        partition=tp.partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=orjson.dumps(value),
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=[],
+    )
+
+
+class FakeConsumer:
+    def __init__(
+        self, batches: list[dict[TopicPartition, Sequence[ConsumerRecord]]]
+    ) -> None:
+        self.batches = batches
+        self.assigned = {tp for batch in batches for tp in batch}
+        self.committed: list[dict[TopicPartition, int]] = []
+        self.commit_error: Optional[Exception] = None
+
+    async def getmany(
+        self, timeout_ms: int, max_records: int
+    ) -> dict[TopicPartition, Sequence[ConsumerRecord]]:
+        await asyncio.sleep(0)
+        return self.batches.pop(0) if self.batches else {}
+
+    async def commit(self, offsets: Optional[dict[TopicPartition, int]] = None) -> None:
+        if self.commit_error is not None:
+            raise self.commit_error
+        assert offsets is not None
+        for tp in offsets:
+            assert tp in self.assigned, f"Partition {tp} is not assigned"
+        self.committed.append(offsets)
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self.assigned)
+
+
+def graph() -> Any:
+    builder = StateGraph(dict)
+    builder.add_node("noop", lambda state: state)
+    builder.add_edge(START, "noop")
+    return builder.compile()
+
+
+async def test_commit_skips_revoked_partitions() -> None:
+    consumer = FakeConsumer(
+        [
+            {
+                P0: [record(P0, 3, {"p": 0})],
+                P1: [record(P1, 7, {"p": 1})],
+            }
+        ]
+    )
+    p1_started = asyncio.Event()
+    p1_release = asyncio.Event()
+
+    async def each(msg: MessageToOrchestrator) -> None:
+        if msg["p"] == 1:  # type: ignore[typeddict-item]
+            p1_started.set()
+            await p1_release.wait()
+
+    async with AsyncKafkaOrchestrator(
+        graph(), TOPICS, consumer=consumer, producer=object()
+    ) as orch:
+        orch.each = each  # type: ignore[method-assign]
+        batch = asyncio.create_task(orch.__anext__())
+        await p1_started.wait()
+        # let the commit for the finished partition go through
+        await asyncio.sleep(0)
+        # rebalance revokes the partition that is still processing
+        consumer.assigned.discard(P1)
+        p1_release.set()
+        assert len(await batch) == 2
+        # next fetch waits for pending commits
+        assert await orch.__anext__() == []
+    assert consumer.committed == [{P0: 4}]
+
+
+async def test_commit_failure_during_rebalance() -> None:
+    consumer = FakeConsumer([{P0: [record(P0, 0, {"p": 0})]}])
+    consumer.commit_error = CommitFailedError("rebalanced")
+
+    async def each(msg: MessageToOrchestrator) -> None:
+        pass
+
+    async with AsyncKafkaOrchestrator(
+        graph(), TOPICS, consumer=consumer, producer=object()
+    ) as orch:
+        orch.each = each  # type: ignore[method-assign]
+        assert len(await orch.__anext__()) == 1
+        assert await orch.__anext__() == []
+    assert consumer.committed == []
@@ -0,0 +1,60 @@
+import math
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from langgraph.scheduler.kafka import serde
+
+pytestmark = pytest.mark.anyio
+
+LC_MESSAGE = (
+    b'{"msg":{"lc":1,"type":"constructor",'
+    b'"id":["langchain","schema","messages","AIMessage"],'
+    b'"kwargs":{"content":"hi"}}}'
+)
+
+
+def test_loads_plain() -> None:
+    assert serde.loads(b'{"a":1,"b":[1,"x",null]}') == {"a": 1, "b": [1, "x", None]}
+
+
+def test_loads_revives_lc_objects() -> None:
+    assert serde.loads(LC_MESSAGE) == {"msg": AIMessage(content="hi")}
+
+
+def test_loads_nan_falls_back() -> None:
+    assert math.isnan(serde.loads(b'{"a":NaN}')["a"])
+
+
+def test_loads_many() -> None:
+    msgs = serde.loads_many([b'{"a":1}', LC_MESSAGE, b'{"a":NaN}'])
+    assert len(msgs) == 3
+    assert msgs[0] == {"a": 1}
+    assert msgs[1] == {"msg": AIMessage(content="hi")}
+    assert math.isnan(msgs[2]["a"])
+
+
+def test_loads_many_empty() -> None:
+    assert serde.loads_many([]) == []
+
+
+@pytest.mark.parametrize(
+    "batch", [[b"1,2", b"3"], [b"[1", b"2]", b"3,4"], [b'{"a":', b"1}"]]
+)
+async def test_loads_many_rejects_partial_values(batch: list[bytes]) -> None:
+    with pytest.raises(ValueError):
+        serde.loads_many(batch)
+    with pytest.raises(ValueError):
+        await serde.aloads_many(batch)
+
+
+async def test_aloads_many() -> None:
+    assert await serde.aloads_many([b'{"a":1}', LC_MESSAGE]) == [
+        {"a": 1},
+        {"msg": AIMessage(content="hi")},
+    ]
+    # large enough to be revived in a thread
+    n = serde.LOADS_IN_THREAD_MIN_BYTES // len(LC_MESSAGE) + 1
+    msgs = await serde.aloads_many([LC_MESSAGE] * n)
+    assert msgs == [{"msg": AIMessage(content="hi")}] * n
+    assert await serde.aloads_many([]) == []